@@ -30,6 +30,7 @@ class SheetsConfig(BaseSettings):
     required_columns: list = Field(default_factory=lambda: ["name", "email"], description="Required column names")
     cache_format: str = Field("both", description="Cache format: csv, json, or both")
     cache_dir: Optional[str] = Field(None, description="Directory for caching recipients")
+    cache_values: bool = Field(False, description="Reuse cached sheet values while the spreadsheet is unchanged")
 
 
 class GmailConfig(BaseSettings):
@@ -77,7 +77,11 @@ def sync(spreadsheet_id: Optional[str], range: str, preview: int, cache: bool, d
                 console.print("[red]Error: Could not load configuration[/red]")
                 sys.exit(1)
             
-            sheets_client = SheetsClient(settings.google)
+            cache_dir = None
+            if settings.sheets.cache_dir:
+                cache_dir = Path(settings.sheets.cache_dir).expanduser()
+            
+            sheets_client = SheetsClient(settings.google, cache_dir=cache_dir)
         except ConfigurationError as e:
             console.print(f"[red]Configuration error: {e.message}[/red]")
             logger.error(f"Configuration error: {e.message}", extra={"context": e.context})
@@ -88,7 +92,8 @@ def sync(spreadsheet_id: Optional[str], range: str, preview: int, cache: bool, d
             recipients_list, errors = sheets_client.fetch_rows(
                 spreadsheet_id=spreadsheet_id,
                 range_name=range,
-                required_columns=settings.sheets.required_columns
+                required_columns=settings.sheets.required_columns,
+                use_cache=settings.sheets.cache_values
             )
         except ConfigurationError as e:
             console.print(f"[red]Error fetching recipients: {e.message}[/red]")
@@ -148,10 +153,6 @@ def sync(spreadsheet_id: Optional[str], range: str, preview: int, cache: bool, d
         # Cache recipients if requested
         if cache:
             try:
-                cache_dir = None
-                if settings.sheets.cache_dir:
-                    cache_dir = Path(settings.sheets.cache_dir)
-                
                 cached_files = sheets_client.cache_recipients(
                     recipients_list,
                     format=settings.sheets.cache_format
@@ -1,11 +1,15 @@
 """Google Sheets integration for autobulk."""
 
 import csv
+import hashlib
 import json
 import logging
+import re
+import sys
 from dataclasses import dataclass, field, asdict
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Sequence, Tuple, Union, cast
 from datetime import datetime
 
 from google.auth.transport.requests import Request
@@ -16,26 +20,59 @@ from googleapiclient import discovery
 from .config import GoogleConfig
 from .exceptions import AuthenticationError, ConfigurationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the stdlib error whichever parser is in use.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 logger = logging.getLogger(__name__)
 
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+
+# Drive metadata is only used to read a spreadsheet's version for the
+# opt-in values cache, so only the Drive client is granted it.
+_DRIVE_SCOPES = SCOPES + ['https://www.googleapis.com/auth/drive.metadata.readonly']
+
+# Compiled once at import; validate_email is called for every sheet row.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# RFC 5321 path limit; also bounds regex backtracking on hostile input.
+_MAX_EMAIL_LENGTH = 254
+
+# Write buffer for recipient cache files; large sheets flush in few syscalls.
+_CACHE_WRITE_BUFFER = 1 << 20
 
-@dataclass
+# Columns every sheet must have unless the caller asks for others.
+_DEFAULT_REQUIRED_COLUMNS = ("name", "email")
+
+# dataclass(slots=True) is only available on Python 3.10+.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Recipient:
-    """Typed recipient data from Google Sheets."""
+    """Typed recipient data from Google Sheets.
+
+    Instances are immutable and slotted: one is built per sheet row, so
+    dropping the per-instance ``__dict__`` matters on large sheets.
+    """
     name: str
     email: str
     custom_fields: Dict[str, Any] = field(default_factory=dict)
 
     def __hash__(self) -> int:
-        """Make recipients hashable for deduplication."""
-        return hash((self.name, self.email))
+        """Hash on the case-insensitive email, the deduplication key."""
+        return hash(self.email.lower())
 
     def __eq__(self, other: object) -> bool:
-        """Check equality for deduplication."""
+        """Recipients are the same person if their emails match, ignoring case."""
         if not isinstance(other, Recipient):
             return NotImplemented
-        return self.name == other.name and self.email == other.email
+        return self.email.lower() == other.email.lower()
 
 
 class ValidationError(Exception):
@@ -49,9 +86,9 @@ class ValidationError(Exception):
 
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    if len(email) > _MAX_EMAIL_LENGTH:
+        return False
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def validate_recipient(row: Dict[str, Any], row_number: int, required_fields: List[str]) -> None:
@@ -63,25 +100,59 @@ def validate_recipient(row: Dict[str, Any], row_number: int, required_fields: Li
         row_number: Row number for error reporting
         required_fields: List of required field names
         
+    Raises:
+        ValidationError: If validation fails
+    """
+    _validate_fields(
+        row_number,
+        ((field, row.get(field)) for field in required_fields),
+        row.get("name", ""),
+        row.get("email", "")
+    )
+
+
+def _validate_fields(
+    row_number: int,
+    required_values: Iterable[Tuple[str, Any]],
+    name: Any,
+    email: Any
+) -> Tuple[str, str]:
+    """
+    Validate the fields of one recipient row.
+    
+    Shared by validate_recipient (dict rows) and SheetsClient, which reads
+    rows positionally.
+    
+    Args:
+        row_number: Row number for error reporting
+        required_values: (field name, cell value) pairs for required fields
+        name: Raw name cell value
+        email: Raw email cell value
+        
+    Returns:
+        Tuple of (stripped name, stripped email)
+        
     Raises:
         ValidationError: If validation fails
     """
     # Check required fields
-    for field in required_fields:
-        if field not in row or not row[field] or (isinstance(row[field], str) and row[field].strip() == ""):
+    for field, value in required_values:
+        if not value or (isinstance(value, str) and value.strip() == ""):
             raise ValidationError(row_number, field, f"Required field missing or empty")
     
     # Validate email
-    email = str(row.get("email", "")).strip()
+    email = str(email).strip()
     if not email:
         raise ValidationError(row_number, "email", "Email is required")
     if not validate_email(email):
         raise ValidationError(row_number, "email", f"Invalid email format: {email}")
     
     # Validate name
-    name = str(row.get("name", "")).strip()
+    name = str(name).strip()
     if not name:
         raise ValidationError(row_number, "name", "Name is required")
+    
+    return name, email
 
 
 class SheetsClient:
@@ -102,8 +173,8 @@ class SheetsClient:
         self.cache_dir = cache_dir or Path.home() / ".autobulk" / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        self._service = None
-        self._credentials = None
+        self._service: Any = None
+        self._credentials: Any = None
         self._initialize_credentials()
 
     def _initialize_credentials(self) -> None:
@@ -125,17 +196,16 @@ class SheetsClient:
                 
                 self._credentials = Credentials.from_service_account_file(
                     str(creds_path),
-                    scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
+                    scopes=SCOPES
                 )
                 logger.info(f"Loaded credentials from file: {self.config.credentials_path}")
                 
             elif self.config.credentials_json:
                 # Load from JSON string
-                import json as json_module
-                creds_dict = json_module.loads(self.config.credentials_json)
+                creds_dict = _json_loads(self.config.credentials_json)
                 self._credentials = Credentials.from_service_account_info(
                     creds_dict,
-                    scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
+                    scopes=SCOPES
                 )
                 logger.info("Loaded credentials from JSON string")
                 
@@ -168,7 +238,8 @@ class SheetsClient:
         self,
         spreadsheet_id: str,
         range_name: str = "Sheet1",
-        required_columns: Optional[List[str]] = None
+        required_columns: Optional[Sequence[str]] = None,
+        use_cache: bool = False
     ) -> tuple[List[Recipient], List[ValidationError]]:
         """
         Fetch and process rows from a Google Sheet.
@@ -177,80 +248,123 @@ class SheetsClient:
             spreadsheet_id: The Google Sheet ID
             range_name: The range to fetch (e.g., "Sheet1" or "Sheet1!A1:C100")
             required_columns: List of required column names
+            use_cache: Reuse values cached on disk while the spreadsheet's
+                Drive version is unchanged
             
         Returns:
             Tuple of (list of recipients, list of validation errors)
         """
+        return self._collect_rows(
+            self.iter_rows(spreadsheet_id, range_name, required_columns, use_cache)
+        )
+
+    def iter_rows(
+        self,
+        spreadsheet_id: str,
+        range_name: str = "Sheet1",
+        required_columns: Optional[Sequence[str]] = None,
+        use_cache: bool = False
+    ) -> Iterator[Union[Recipient, ValidationError]]:
+        """
+        Fetch rows from a Google Sheet and yield them one at a time.
+        
+        The range is still downloaded in one API call, but recipients are
+        validated and built lazily, so callers that process them one by one
+        never hold the full recipient list in memory.
+        
+        Args:
+            spreadsheet_id: The Google Sheet ID
+            range_name: The range to fetch (e.g., "Sheet1" or "Sheet1!A1:C100")
+            required_columns: List of required column names
+            use_cache: Reuse values cached on disk while the spreadsheet's
+                Drive version is unchanged
+            
+        Yields:
+            A Recipient for each valid, unique row, or the ValidationError
+            for each invalid row, in sheet order
+            
+        Raises:
+            ConfigurationError: If the sheet cannot be read or required
+                columns are missing
+        """
         if required_columns is None:
-            required_columns = ["name", "email"]
+            required_columns = _DEFAULT_REQUIRED_COLUMNS
         
         try:
-            # Fetch data
-            result = self._service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name
-            ).execute()
+            if use_cache:
+                values = self._get_cached_values(spreadsheet_id, range_name)
+            else:
+                values = self._get_values(spreadsheet_id, range_name)
+            yield from self._iter_values(values, range_name, required_columns)
             
-            values = result.get('values', [])
+        except ConfigurationError:
+            raise
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to fetch rows from sheet: {e}",
+                cause=e,
+                context={
+                    "spreadsheet_id": spreadsheet_id,
+                    "range": range_name,
+                    "error": str(e)
+                }
+            )
+
+    def fetch_rows_batch(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str],
+        required_columns: Optional[Sequence[str]] = None
+    ) -> Dict[str, tuple[List[Recipient], List[ValidationError]]]:
+        """
+        Fetch and process several ranges of a Google Sheet in one API call.
+        
+        Each range is validated and deduplicated independently, exactly as
+        fetch_rows would do for it. A range listed more than once is fetched
+        once and appears once in the result.
+        
+        Args:
+            spreadsheet_id: The Google Sheet ID
+            ranges: The ranges to fetch (e.g., ["Sheet1", "Sheet2!A1:C100"])
+            required_columns: List of required column names
             
-            if not values:
-                logger.warning(f"No data found in range: {range_name}")
-                return [], []
+        Returns:
+            Dictionary mapping each requested range to a tuple of
+            (list of recipients, list of validation errors)
             
-            # First row is headers
-            headers = [h.strip().lower() for h in values[0]]
+        Raises:
+            ConfigurationError: If the sheet cannot be read, required columns
+                are missing, or the API does not return one value range per
+                requested range
+        """
+        if required_columns is None:
+            required_columns = _DEFAULT_REQUIRED_COLUMNS
+        ranges = list(dict.fromkeys(ranges))
+        
+        try:
+            result = self._service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges
+            ).execute()
             
-            # Check required columns
-            missing_columns = set(required_columns) - set(headers)
-            if missing_columns:
+            # valueRanges come back in request order, but with normalized
+            # range names, so key the results by the ranges we asked for
+            value_ranges = result.get('valueRanges', [])
+            if len(value_ranges) != len(ranges):
                 raise ConfigurationError(
-                    f"Missing required columns: {', '.join(missing_columns)}",
-                    context={"missing": list(missing_columns), "headers": headers}
-                )
-            
-            # Process rows
-            recipients = []
-            errors = []
-            seen = set()  # For deduplication
-            
-            for row_num, row_values in enumerate(values[1:], start=2):
-                try:
-                    # Pad row with empty strings if necessary
-                    row_values = row_values + [''] * (len(headers) - len(row_values))
-                    
-                    # Create row dictionary
-                    row_dict = {
-                        headers[i]: row_values[i] if i < len(row_values) else ""
-                        for i in range(len(headers))
+                    f"Expected {len(ranges)} value ranges from sheet, got {len(value_ranges)}",
+                    context={
+                        "spreadsheet_id": spreadsheet_id,
+                        "ranges": ranges,
+                        "returned": len(value_ranges)
                     }
-                    
-                    # Validate row
-                    validate_recipient(row_dict, row_num, required_columns)
-                    
-                    # Extract standard fields
-                    name = str(row_dict.get("name", "")).strip()
-                    email = str(row_dict.get("email", "")).strip()
-                    
-                    # Extract custom fields
-                    custom_fields = {
-                        k: v for k, v in row_dict.items()
-                        if k not in ("name", "email") and v
-                    }
-                    
-                    # Deduplicate
-                    recipient = Recipient(name=name, email=email, custom_fields=custom_fields)
-                    if recipient not in seen:
-                        recipients.append(recipient)
-                        seen.add(recipient)
-                    else:
-                        logger.debug(f"Duplicate recipient skipped: {email}")
-                
-                except ValidationError as e:
-                    errors.append(e)
-                    logger.warning(f"Validation error: {e}")
-            
-            logger.info(f"Fetched {len(recipients)} recipients with {len(errors)} validation errors")
-            return recipients, errors
+                )
+            return {
+                range_name: self._collect_rows(self._iter_values(
+                    value_range.get('values', []), range_name, required_columns
+                ))
+                for range_name, value_range in zip(ranges, value_ranges)
+            }
             
         except ConfigurationError:
             raise
@@ -260,11 +374,185 @@ class SheetsClient:
                 cause=e,
                 context={
                     "spreadsheet_id": spreadsheet_id,
-                    "range": range_name,
+                    "ranges": ranges,
                     "error": str(e)
                 }
             )
 
+    @cached_property
+    def _drive_service(self) -> Any:
+        """Drive API service, used to look up spreadsheet versions."""
+        return discovery.build(
+            'drive', 'v3',
+            credentials=self._credentials.with_scopes(_DRIVE_SCOPES),
+            cache_discovery=False
+        )
+
+    def _get_values(self, spreadsheet_id: str, range_name: str) -> List[List[Any]]:
+        """Fetch raw cell values for a range from the Sheets API."""
+        result = self._service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id,
+            range=range_name
+        ).execute()
+        return cast(List[List[Any]], result.get('values', []))
+
+    def _get_cached_values(self, spreadsheet_id: str, range_name: str) -> List[List[Any]]:
+        """
+        Fetch raw cell values, reusing the on-disk copy if the sheet is unchanged.
+        
+        The Sheets API exposes no revision id, so the spreadsheet's Drive
+        ``version`` (bumped on every edit) is used as the cache key. If the
+        version cannot be read, values are fetched without caching.
+        
+        Args:
+            spreadsheet_id: The Google Sheet ID
+            range_name: The range to fetch
+            
+        Returns:
+            Raw cell values, with the header row first
+        """
+        try:
+            version = self._drive_service.files().get(
+                fileId=spreadsheet_id,
+                fields='version',
+                supportsAllDrives=True
+            ).execute()['version']
+        except Exception as e:
+            logger.warning(f"Could not read spreadsheet version, skipping values cache: {e}")
+            return self._get_values(spreadsheet_id, range_name)
+        
+        range_key = hashlib.sha1(range_name.encode('utf-8')).hexdigest()[:16]
+        cache_file = self.cache_dir / f"values_{spreadsheet_id}_{range_key}.json"
+        
+        try:
+            cached = _json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            cached = None
+        
+        # Anything but a matching {version, range, values} object is a miss,
+        # so a stale or malformed file gets overwritten below
+        if (
+            isinstance(cached, dict)
+            and cached.get('version') == version
+            and cached.get('range') == range_name
+            and isinstance(cached.get('values'), list)
+        ):
+            logger.info(f"Using cached values for {range_name} (version {version})")
+            return cast(List[List[Any]], cached['values'])
+        
+        values = self._get_values(spreadsheet_id, range_name)
+        try:
+            cache_file.write_text(
+                json.dumps({'version': version, 'range': range_name, 'values': values}),
+                encoding='utf-8'
+            )
+        except OSError as e:
+            logger.warning(f"Failed to write values cache {cache_file}: {e}")
+        return values
+
+    @staticmethod
+    def _collect_rows(
+        rows: Iterable[Union[Recipient, ValidationError]]
+    ) -> tuple[List[Recipient], List[ValidationError]]:
+        """Split a stream of parsed rows into recipients and validation errors."""
+        recipients = []
+        errors = []
+        for row in rows:
+            if isinstance(row, ValidationError):
+                errors.append(row)
+            else:
+                recipients.append(row)
+        
+        logger.info(f"Fetched {len(recipients)} recipients with {len(errors)} validation errors")
+        return recipients, errors
+
+    def _iter_values(
+        self,
+        values: List[List[Any]],
+        range_name: str,
+        required_columns: Sequence[str]
+    ) -> Iterator[Union[Recipient, ValidationError]]:
+        """
+        Validate and deduplicate raw sheet values into recipients.
+        
+        Args:
+            values: Raw cell values, with the header row first
+            range_name: The range the values came from, for logging
+            required_columns: List of required column names
+            
+        Yields:
+            A Recipient for each valid, unique row, or a ValidationError
+            
+        Raises:
+            ConfigurationError: If required columns are missing
+        """
+        if not values:
+            logger.warning(f"No data found in range: {range_name}")
+            return
+        
+        # First row is headers
+        headers = [h.strip().lower() for h in values[0]]
+        
+        # Check required columns
+        missing_columns = set(required_columns) - set(headers)
+        if missing_columns:
+            raise ConfigurationError(
+                f"Missing required columns: {', '.join(missing_columns)}",
+                context={"missing": list(missing_columns), "headers": headers}
+            )
+        
+        # Map each column name to its position once, so rows can be read by
+        # index instead of being turned into dicts. A repeated header maps
+        # to its last column.
+        column_index = {header: i for i, header in enumerate(headers)}
+        # Listing a required column twice still checks it only once per row
+        required_index = [
+            (column, column_index[column]) for column in dict.fromkeys(required_columns)
+        ]
+        name_index = column_index.get("name")
+        email_index = column_index.get("email")
+        custom_index = [
+            (column, i) for column, i in column_index.items()
+            if column not in ("name", "email")
+        ]
+        width = len(headers)
+        
+        # Process rows
+        seen_emails = set()  # Normalized emails, for deduplication
+        
+        for row_num, row_values in enumerate(values[1:], start=2):
+            try:
+                # Pad row with empty strings if necessary
+                if len(row_values) < width:
+                    row_values = row_values + [''] * (width - len(row_values))
+                
+                # Validate row and extract standard fields
+                name, email = _validate_fields(
+                    row_num,
+                    ((column, row_values[i]) for column, i in required_index),
+                    row_values[name_index] if name_index is not None else "",
+                    row_values[email_index] if email_index is not None else ""
+                )
+                
+                # Deduplicate on the email alone, before building anything
+                email_key = email.lower()
+                if email_key in seen_emails:
+                    logger.debug(f"Duplicate recipient skipped: {email}")
+                    continue
+                seen_emails.add(email_key)
+                
+                # Extract custom fields
+                custom_fields = {
+                    column: row_values[i] for column, i in custom_index
+                    if row_values[i]
+                }
+                
+            except ValidationError as e:
+                logger.warning(f"Validation error: {e}")
+                yield e
+            else:
+                yield Recipient(name=name, email=email, custom_fields=custom_fields)
+
     def cache_recipients(
         self,
         recipients: List[Recipient],
@@ -286,31 +574,39 @@ class SheetsClient:
         try:
             if format in ("csv", "both"):
                 csv_path = self.cache_dir / f"recipients_{timestamp}.csv"
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                with open(
+                    csv_path, 'w', newline='', encoding='utf-8',
+                    buffering=_CACHE_WRITE_BUFFER
+                ) as f:
                     if recipients:
-                        writer = csv.DictWriter(
-                            f,
-                            fieldnames=["name", "email", "custom_fields"]
+                        writer = csv.writer(f)
+                        writer.writerow(["name", "email", "custom_fields"])
+                        writer.writerows(
+                            (r.name, r.email, json.dumps(r.custom_fields))
+                            for r in recipients
                         )
-                        writer.writeheader()
-                        for recipient in recipients:
-                            writer.writerow({
-                                "name": recipient.name,
-                                "email": recipient.email,
-                                "custom_fields": json.dumps(recipient.custom_fields)
-                            })
                 result["csv"] = csv_path
                 logger.info(f"Cached recipients to CSV: {csv_path}")
             
             if format in ("json", "both"):
                 json_path = self.cache_dir / f"recipients_{timestamp}.json"
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(
-                        [asdict(r) for r in recipients],
-                        f,
-                        indent=2,
-                        ensure_ascii=False
+                if orjson is not None:
+                    # orjson serializes the dataclasses directly, as UTF-8,
+                    # but only inside a list or tuple, not any iterable
+                    json_path.write_bytes(
+                        orjson.dumps(list(recipients), option=orjson.OPT_INDENT_2)
                     )
+                else:
+                    with open(
+                        json_path, 'w', encoding='utf-8',
+                        buffering=_CACHE_WRITE_BUFFER
+                    ) as f:
+                        json.dump(
+                            [asdict(r) for r in recipients],
+                            f,
+                            indent=2,
+                            ensure_ascii=False
+                        )
                 result["json"] = json_path
                 logger.info(f"Cached recipients to JSON: {json_path}")
             
@@ -0,0 +1,80 @@
+"""Shared fixtures for autobulk tests."""
+
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from autobulk.config import GoogleConfig
+from autobulk.sheets import SheetsClient
+
+
+class FakeSheetsService:
+    """
+    Lightweight stand-in for the discovery-built Sheets and Drive services.
+
+    Set ``values``, ``batch_values`` or ``version`` to the response the
+    matching request should return, or to an exception it should raise.
+    Every request is recorded in ``calls`` as ``(method, kwargs)``.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.batch_values = {}
+        self.version = {}
+        self.calls = []
+
+        values_resource = SimpleNamespace(
+            get=self._request('values.get', 'values'),
+            batchGet=self._request('values.batchGet', 'batch_values'),
+        )
+        self._spreadsheets = SimpleNamespace(values=lambda: values_resource)
+        self._files = SimpleNamespace(get=self._request('files.get', 'version'))
+
+    def spreadsheets(self):
+        return self._spreadsheets
+
+    def files(self):
+        return self._files
+
+    def calls_to(self, method):
+        """Return the keyword arguments of every request to ``method``."""
+        return [kwargs for name, kwargs in self.calls if name == method]
+
+    def _request(self, method, response_attr):
+        def build_request(**kwargs):
+            self.calls.append((method, kwargs))
+            return SimpleNamespace(execute=lambda: self._respond(response_attr))
+        return build_request
+
+    def _respond(self, response_attr):
+        response = getattr(self, response_attr)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def sheets_client_factory():
+    """
+    Factory for SheetsClient instances backed by a FakeSheetsService.
+
+    The credential and discovery patches are active for the requesting
+    test only. Every client built in that test shares one fake service, so
+    lazily built API clients (e.g. Drive) see the same responses; each call
+    returns a new ``(client, service)`` pair.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch('autobulk.sheets.Credentials.from_service_account_info'))
+        mock_build = stack.enter_context(patch('googleapiclient.discovery.build'))
+        service = FakeSheetsService()
+        mock_build.return_value = service
+
+        def make_client(cache_dir=None):
+            client = SheetsClient(
+                GoogleConfig(credentials_json='{}'), cache_dir=cache_dir
+            )
+            return client, service
+
+        yield make_client
@@ -1,8 +1,12 @@
 """Unit tests for Google Sheets integration."""
 
 import pytest
+import csv
+import io
 import json
 import tempfile
+from contextlib import ExitStack
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
@@ -49,6 +53,24 @@ class TestRecipientDataclass:
         
         # Should not add duplicate
         assert recipient2 not in seen or recipient1 == recipient2
+    
+    def test_recipient_equality_uses_email_case_insensitively(self):
+        """Test that recipients with the same email, in any case, are equal."""
+        recipient1 = Recipient(name="John Doe", email="John@Example.com")
+        recipient2 = Recipient(name="J. Doe", email="john@example.com")
+        recipient3 = Recipient(name="John Doe", email="jane@example.com")
+        
+        assert recipient1 == recipient2
+        assert hash(recipient1) == hash(recipient2)
+        assert recipient1 != recipient3
+        assert len({recipient1, recipient2, recipient3}) == 2
+    
+    def test_recipient_immutable(self):
+        """Test that recipients cannot be modified after creation."""
+        recipient = Recipient(name="John Doe", email="john@example.com")
+        
+        with pytest.raises(FrozenInstanceError):
+            recipient.email = "other@example.com"
 
 
 class TestEmailValidation:
@@ -74,6 +96,8 @@ class TestEmailValidation:
             "user@.com",
             "user @example.com",
             "user@example",
+            "user@example.com\n",
+            "a" * 250 + "@example.com",
         ]
         for email in invalid_emails:
             assert not validate_email(email), f"Expected {email} to be invalid"
@@ -192,12 +216,12 @@ class TestSheetsClientInitialization:
         """Test that cache directory is created."""
         config = GoogleConfig(credentials_json='{}')
         
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with ExitStack() as stack:
+            tmpdir = stack.enter_context(tempfile.TemporaryDirectory())
+            stack.enter_context(patch('autobulk.sheets.Credentials.from_service_account_info'))
+            stack.enter_context(patch('googleapiclient.discovery.build'))
             cache_dir = Path(tmpdir) / "cache"
-            
-            with patch('autobulk.sheets.Credentials.from_service_account_info'):
-                with patch('googleapiclient.discovery.build'):
-                    client = SheetsClient(config, cache_dir=cache_dir)
+            client = SheetsClient(config, cache_dir=cache_dir)
             
             # Cache directory might not exist yet, but should be set
             assert client.cache_dir == cache_dir
@@ -206,24 +230,12 @@ class TestSheetsClientInitialization:
 class TestSheetsClientFetchRows:
     """Tests for fetching rows from sheets."""
     
-    def _create_mock_client(self):
-        """Helper to create a mocked SheetsClient."""
-        config = GoogleConfig(credentials_json='{}')
-        
-        with patch('autobulk.sheets.Credentials.from_service_account_info'):
-            with patch('googleapiclient.discovery.build') as mock_build:
-                mock_service = MagicMock()
-                mock_build.return_value = mock_service
-                
-                client = SheetsClient(config)
-                return client, mock_service
-    
-    def test_fetch_rows_success(self):
+    def test_fetch_rows_success(self, sheets_client_factory):
         """Test successful row fetching."""
-        client, mock_service = self._create_mock_client()
+        client, service = sheets_client_factory()
         
         # Mock the API response
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        service.values = {
             'values': [
                 ['Name', 'Email'],
                 ['John Doe', 'john@example.com'],
@@ -239,11 +251,11 @@ class TestSheetsClientFetchRows:
         assert recipients[0].email == "john@example.com"
         assert recipients[1].name == "Jane Smith"
     
-    def test_fetch_rows_with_custom_fields(self):
+    def test_fetch_rows_with_custom_fields(self, sheets_client_factory):
         """Test fetching rows with custom fields."""
-        client, mock_service = self._create_mock_client()
+        client, service = sheets_client_factory()
         
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        service.values = {
             'values': [
                 ['Name', 'Email', 'Company', 'Department'],
                 ['John Doe', 'john@example.com', 'Acme', 'Sales'],
@@ -255,11 +267,31 @@ class TestSheetsClientFetchRows:
         assert len(recipients) == 1
         assert recipients[0].custom_fields == {'company': 'Acme', 'department': 'Sales'}
     
-    def test_fetch_rows_with_validation_errors(self):
+    def test_fetch_rows_with_short_rows(self, sheets_client_factory):
+        """Test that rows with trailing empty cells omitted are padded."""
+        client, service = sheets_client_factory()
+        
+        service.values = {
+            'values': [
+                ['Company', 'Name', 'Email', 'Department'],
+                ['Acme', 'John Doe', 'john@example.com'],
+                ['', 'Jane Smith'],
+            ]
+        }
+        
+        recipients, errors = client.fetch_rows('test-sheet')
+        
+        assert len(recipients) == 1
+        assert recipients[0].custom_fields == {'company': 'Acme'}
+        assert len(errors) == 1
+        assert errors[0].row_number == 3
+        assert errors[0].field == "email"
+    
+    def test_fetch_rows_with_validation_errors(self, sheets_client_factory):
         """Test fetching rows with validation errors."""
-        client, mock_service = self._create_mock_client()
+        client, service = sheets_client_factory()
         
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        service.values = {
             'values': [
                 ['Name', 'Email'],
                 ['John Doe', 'john@example.com'],
@@ -274,11 +306,32 @@ class TestSheetsClientFetchRows:
         assert len(errors) == 1
         assert errors[0].row_number == 3  # Zero-indexed becomes 1-indexed
     
-    def test_fetch_rows_deduplication(self):
+    def test_fetch_rows_duplicate_required_columns(self, sheets_client_factory):
+        """Test that a repeated required column is only checked once per row."""
+        client, service = sheets_client_factory()
+        
+        service.values = {
+            'values': [
+                ['Name', 'Email'],
+                ['John Doe', ''],
+                ['Jane Smith', 'jane@example.com'],
+            ]
+        }
+        
+        recipients, errors = client.fetch_rows(
+            'test-sheet', required_columns=['email', 'email', 'name']
+        )
+        
+        assert [r.email for r in recipients] == ['jane@example.com']
+        assert len(errors) == 1
+        assert errors[0].row_number == 2
+        assert errors[0].field == 'email'
+    
+    def test_fetch_rows_deduplication(self, sheets_client_factory):
         """Test that duplicate recipients are removed."""
-        client, mock_service = self._create_mock_client()
+        client, service = sheets_client_factory()
         
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        service.values = {
             'values': [
                 ['Name', 'Email'],
                 ['John Doe', 'john@example.com'],
@@ -292,11 +345,28 @@ class TestSheetsClientFetchRows:
         assert len(recipients) == 2
         assert len(errors) == 0
     
-    def test_fetch_rows_missing_required_columns(self):
+    def test_fetch_rows_deduplication_by_email(self, sheets_client_factory):
+        """Test that duplicates are detected by case-insensitive email."""
+        client, service = sheets_client_factory()
+        
+        service.values = {
+            'values': [
+                ['Name', 'Email'],
+                ['John Doe', 'john@example.com'],
+                ['Johnny Doe', 'John@Example.com'],  # Same address
+            ]
+        }
+        
+        recipients, errors = client.fetch_rows('test-sheet')
+        
+        assert len(recipients) == 1
+        assert recipients[0].name == "John Doe"
+    
+    def test_fetch_rows_missing_required_columns(self, sheets_client_factory):
         """Test error when required columns are missing."""
-        client, mock_service = self._create_mock_client()
+        client, service = sheets_client_factory()
         
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        service.values = {
             'values': [
                 ['Name'],  # Missing 'email' column
                 ['John Doe'],
@@ -308,22 +378,22 @@ class TestSheetsClientFetchRows:
         
         assert "Missing required columns" in exc_info.value.message
     
-    def test_fetch_rows_empty_sheet(self):
+    def test_fetch_rows_empty_sheet(self, sheets_client_factory):
         """Test handling empty sheet."""
-        client, mock_service = self._create_mock_client()
+        client, service = sheets_client_factory()
         
-        mock_service.spreadsheets().values().get().execute.return_value = {}
+        service.values = {}
         
         recipients, errors = client.fetch_rows('test-sheet')
         
         assert len(recipients) == 0
         assert len(errors) == 0
     
-    def test_fetch_rows_custom_range(self):
+    def test_fetch_rows_custom_range(self, sheets_client_factory):
         """Test fetching with custom range."""
-        client, mock_service = self._create_mock_client()
+        client, service = sheets_client_factory()
         
-        mock_service.spreadsheets().values().get().execute.return_value = {
+        service.values = {
             'values': [
                 ['Name', 'Email'],
                 ['John Doe', 'john@example.com'],
@@ -333,121 +403,312 @@ class TestSheetsClientFetchRows:
         recipients, errors = client.fetch_rows('test-sheet', range_name='Sheet1!A1:B100')
         
         # Verify the range was passed correctly
-        call_args = mock_service.spreadsheets().values().get.call_args
-        assert call_args[1]['range'] == 'Sheet1!A1:B100'
+        assert service.calls_to('values.get')[-1]['range'] == 'Sheet1!A1:B100'
+    
+    def test_iter_rows_yields_in_sheet_order(self, sheets_client_factory):
+        """Test that iter_rows yields recipients and errors lazily, in order."""
+        client, service = sheets_client_factory()
+        
+        service.values = {
+            'values': [
+                ['Name', 'Email'],
+                ['John Doe', 'john@example.com'],
+                ['', 'invalid-email'],
+                ['Jane Smith', 'jane@example.com'],
+            ]
+        }
+        
+        rows = client.iter_rows('test-sheet')
+        
+        assert isinstance(next(rows), Recipient)
+        assert isinstance(next(rows), ValidationError)
+        assert next(rows).email == "jane@example.com"
+        assert next(rows, None) is None
+    
+    def test_iter_rows_missing_required_columns(self, sheets_client_factory):
+        """Test that iter_rows raises on a bad header when first advanced."""
+        client, service = sheets_client_factory()
+        
+        service.values = {
+            'values': [['Name'], ['John Doe']]
+        }
+        
+        rows = client.iter_rows('test-sheet')
+        
+        with pytest.raises(ConfigurationError):
+            next(rows)
+    
+    def test_fetch_rows_batch(self, sheets_client_factory):
+        """Test fetching several ranges with a single batchGet call."""
+        client, service = sheets_client_factory()
+        
+        service.batch_values = {
+            'valueRanges': [
+                {
+                    'range': "'Sheet1'!A1:Z1000",
+                    'values': [
+                        ['Name', 'Email'],
+                        ['John Doe', 'john@example.com'],
+                    ]
+                },
+                {
+                    'range': "'Sheet2'!A1:Z1000",
+                    'values': [
+                        ['Name', 'Email'],
+                        ['Jane Smith', 'jane@example.com'],
+                        ['', 'invalid-email'],
+                    ]
+                },
+            ]
+        }
+        
+        results = client.fetch_rows_batch('test-sheet', ['Sheet1', 'Sheet2'])
+        
+        assert service.calls_to('values.batchGet')[-1]['ranges'] == ['Sheet1', 'Sheet2']
+        
+        recipients, errors = results['Sheet1']
+        assert [r.email for r in recipients] == ['john@example.com']
+        assert errors == []
+        
+        recipients, errors = results['Sheet2']
+        assert [r.email for r in recipients] == ['jane@example.com']
+        assert len(errors) == 1
+    
+    def test_fetch_rows_batch_repeated_range(self, sheets_client_factory):
+        """Test that a repeated range is requested and returned once."""
+        client, service = sheets_client_factory()
+        
+        service.batch_values = {
+            'valueRanges': [
+                {'values': [['Name', 'Email'], ['John Doe', 'john@example.com']]},
+            ]
+        }
+        
+        results = client.fetch_rows_batch('test-sheet', ['Sheet1', 'Sheet1'])
+        
+        assert service.calls_to('values.batchGet')[-1]['ranges'] == ['Sheet1']
+        assert list(results) == ['Sheet1']
+        assert [r.email for r in results['Sheet1'][0]] == ['john@example.com']
+    
+    def test_fetch_rows_batch_missing_value_range(self, sheets_client_factory):
+        """Test error when the API returns fewer value ranges than requested."""
+        client, service = sheets_client_factory()
+        
+        service.batch_values = {
+            'valueRanges': [
+                {'values': [['Name', 'Email'], ['John Doe', 'john@example.com']]},
+            ]
+        }
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            client.fetch_rows_batch('test-sheet', ['Sheet1', 'Sheet2'])
+        
+        assert "Expected 2 value ranges" in exc_info.value.message
 
 
-class TestSheetsClientCaching:
-    """Tests for recipient caching."""
+class TestSheetsClientValuesCache:
+    """Tests for caching raw sheet values by spreadsheet version."""
     
-    def _create_mock_client(self):
-        """Helper to create a mocked SheetsClient."""
-        config = GoogleConfig(credentials_json='{}')
+    SHEET_VALUES = {
+        'values': [
+            ['Name', 'Email', 'Company'],
+            ['John Doe', 'john@example.com', 'Acme'],
+        ]
+    }
+    
+    def test_drive_scope_only_requested_for_cache(self, sheets_client_factory, tmp_path):
+        """Test that the Drive metadata scope is only requested when caching."""
+        client, service = sheets_client_factory(cache_dir=tmp_path)
+        service.version = {'version': '7'}
+        service.values = self.SHEET_VALUES
+        
+        client.fetch_rows('test-sheet')
+        client._credentials.with_scopes.assert_not_called()
+        
+        client.fetch_rows('test-sheet', use_cache=True)
+        client._credentials.with_scopes.assert_called_once_with([
+            'https://www.googleapis.com/auth/spreadsheets.readonly',
+            'https://www.googleapis.com/auth/drive.metadata.readonly',
+        ])
+    
+    def test_cached_values_reused_while_version_unchanged(self, sheets_client_factory, tmp_path):
+        """Test that an unchanged sheet is served from the cache."""
+        client, service = sheets_client_factory(cache_dir=tmp_path)
+        service.version = {'version': '7'}
+        service.values = self.SHEET_VALUES
+        
+        first, _ = client.fetch_rows('test-sheet', use_cache=True)
+        second, _ = client.fetch_rows('test-sheet', use_cache=True)
+        
+        assert len(service.calls_to('values.get')) == 1
+        assert [(r.name, r.email, r.custom_fields) for r in second] == [
+            (r.name, r.email, r.custom_fields) for r in first
+        ]
+        assert second[0].custom_fields == {"company": "Acme"}
+    
+    def test_cached_values_refreshed_when_version_changes(self, sheets_client_factory, tmp_path):
+        """Test that an edited sheet is fetched again."""
+        client, service = sheets_client_factory(cache_dir=tmp_path)
+        service.values = self.SHEET_VALUES
         
-        with patch('autobulk.sheets.Credentials.from_service_account_info'):
-            with patch('googleapiclient.discovery.build'):
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    client = SheetsClient(config, cache_dir=Path(tmpdir))
-                    yield client, Path(tmpdir)
+        service.version = {'version': '7'}
+        client.fetch_rows('test-sheet', use_cache=True)
+        service.version = {'version': '8'}
+        client.fetch_rows('test-sheet', use_cache=True)
+        
+        assert len(service.calls_to('values.get')) == 2
     
-    def test_cache_recipients_csv(self):
+    @pytest.mark.parametrize("cached", [
+        [],
+        "values",
+        {"version": "7", "range": "Sheet1"},
+    ])
+    def test_malformed_cache_file_is_refetched(self, sheets_client_factory, tmp_path, cached):
+        """Test that a cache file with an unexpected shape is treated as a miss."""
+        client, service = sheets_client_factory(cache_dir=tmp_path)
+        service.version = {'version': '7'}
+        service.values = self.SHEET_VALUES
+        
+        client.fetch_rows('test-sheet', use_cache=True)
+        cache_file, = tmp_path.glob("values_*.json")
+        cache_file.write_text(json.dumps(cached), encoding="utf-8")
+        
+        recipients, errors = client.fetch_rows('test-sheet', use_cache=True)
+        
+        assert len(recipients) == 1
+        assert len(service.calls_to('values.get')) == 2
+        rewritten = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert rewritten["values"] == self.SHEET_VALUES["values"]
+    
+    def test_cache_skipped_when_version_unavailable(self, sheets_client_factory, tmp_path):
+        """Test that values are still fetched if the Drive lookup fails."""
+        client, service = sheets_client_factory(cache_dir=tmp_path)
+        service.version = Exception("403")
+        service.values = self.SHEET_VALUES
+        
+        recipients, errors = client.fetch_rows('test-sheet', use_cache=True)
+        
+        assert len(recipients) == 1
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestSheetsClientCaching:
+    """Tests for recipient caching."""
+    
+    def test_cache_recipients_csv(self, sheets_client_factory, tmp_path):
         """Test caching recipients to CSV."""
-        config = GoogleConfig(credentials_json='{}')
+        client, _ = sheets_client_factory(cache_dir=tmp_path)
         
-        with patch('autobulk.sheets.Credentials.from_service_account_info'):
-            with patch('googleapiclient.discovery.build'):
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    client = SheetsClient(config, cache_dir=Path(tmpdir))
-                    
-                    recipients = [
-                        Recipient("John Doe", "john@example.com", {"company": "Acme"}),
-                        Recipient("Jane Smith", "jane@example.com", {}),
-                    ]
-                    
-                    result = client.cache_recipients(recipients, format="csv")
-                    
-                    assert "csv" in result
-                    csv_file = result["csv"]
-                    assert csv_file.exists()
-                    
-                    # Verify CSV content
-                    content = csv_file.read_text()
-                    assert "John Doe" in content
-                    assert "john@example.com" in content
-    
-    def test_cache_recipients_json(self):
+        recipients = [
+            Recipient("John Doe", "john@example.com", {"company": "Acme"}),
+            Recipient("Jane Smith", "jane@example.com", {}),
+        ]
+        
+        result = client.cache_recipients(recipients, format="csv")
+        
+        assert "csv" in result
+        csv_file = result["csv"]
+        assert csv_file.exists()
+        
+        # Verify CSV content
+        content = csv_file.read_text()
+        assert "John Doe" in content
+        assert "john@example.com" in content
+        
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert len(rows) == 2
+        assert json.loads(rows[0]["custom_fields"]) == {"company": "Acme"}
+        assert json.loads(rows[1]["custom_fields"]) == {}
+    
+    def test_cache_recipients_json(self, sheets_client_factory, tmp_path):
         """Test caching recipients to JSON."""
-        config = GoogleConfig(credentials_json='{}')
+        client, _ = sheets_client_factory(cache_dir=tmp_path)
         
-        with patch('autobulk.sheets.Credentials.from_service_account_info'):
-            with patch('googleapiclient.discovery.build'):
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    client = SheetsClient(config, cache_dir=Path(tmpdir))
-                    
-                    recipients = [
-                        Recipient("John Doe", "john@example.com", {"company": "Acme"}),
-                    ]
-                    
-                    result = client.cache_recipients(recipients, format="json")
-                    
-                    assert "json" in result
-                    json_file = result["json"]
-                    assert json_file.exists()
-                    
-                    # Verify JSON content
-                    data = json.loads(json_file.read_text())
-                    assert len(data) == 1
-                    assert data[0]["name"] == "John Doe"
-                    assert data[0]["email"] == "john@example.com"
-    
-    def test_cache_recipients_both(self):
+        recipients = [
+            Recipient("John Doe", "john@example.com", {"company": "Acme"}),
+        ]
+        
+        result = client.cache_recipients(recipients, format="json")
+        
+        assert "json" in result
+        json_file = result["json"]
+        assert json_file.exists()
+        
+        # Verify JSON content
+        data = json.loads(json_file.read_text())
+        assert len(data) == 1
+        assert data[0]["name"] == "John Doe"
+        assert data[0]["email"] == "john@example.com"
+    
+    def test_cache_recipients_json_matches_stdlib(self, sheets_client_factory, tmp_path):
+        """Test that the JSON cache is the same with or without orjson."""
+        client, _ = sheets_client_factory(cache_dir=tmp_path)
+        
+        recipients = [
+            Recipient("José María", "jose@example.com", {"company": "Acme"}),
+            Recipient("Jane Smith", "jane@example.com", {}),
+        ]
+        
+        fast = client.cache_recipients(recipients, format="json")["json"]
+        fast_data = json.loads(fast.read_text(encoding="utf-8"))
+        fast.unlink()
+        with patch('autobulk.sheets.orjson', None):
+            slow = client.cache_recipients(recipients, format="json")["json"]
+        slow_data = json.loads(slow.read_text(encoding="utf-8"))
+        
+        assert fast_data == slow_data
+        assert fast_data[0]["name"] == "José María"
+    
+    def test_cache_recipients_json_from_set(self, sheets_client_factory, tmp_path):
+        """Test that a set of recipients can be cached as JSON."""
+        client, _ = sheets_client_factory(cache_dir=tmp_path)
+        
+        recipients = {
+            Recipient("John Doe", "john@example.com"),
+            Recipient("Jane Smith", "jane@example.com"),
+        }
+        
+        json_path = client.cache_recipients(recipients, format="json")["json"]
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        
+        assert sorted(r["email"] for r in data) == ["jane@example.com", "john@example.com"]
+    
+    def test_cache_recipients_both(self, sheets_client_factory, tmp_path):
         """Test caching recipients to both CSV and JSON."""
-        config = GoogleConfig(credentials_json='{}')
+        client, _ = sheets_client_factory(cache_dir=tmp_path)
         
-        with patch('autobulk.sheets.Credentials.from_service_account_info'):
-            with patch('googleapiclient.discovery.build'):
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    client = SheetsClient(config, cache_dir=Path(tmpdir))
-                    
-                    recipients = [
-                        Recipient("John Doe", "john@example.com"),
-                    ]
-                    
-                    result = client.cache_recipients(recipients, format="both")
-                    
-                    assert "csv" in result
-                    assert "json" in result
-                    assert result["csv"].exists()
-                    assert result["json"].exists()
+        recipients = [
+            Recipient("John Doe", "john@example.com"),
+        ]
+        
+        result = client.cache_recipients(recipients, format="both")
+        
+        assert "csv" in result
+        assert "json" in result
+        assert result["csv"].exists()
+        assert result["json"].exists()
 
 
 class TestPagination:
     """Tests for handling large datasets with pagination."""
     
-    def test_fetch_rows_with_many_rows(self):
+    def test_fetch_rows_with_many_rows(self, sheets_client_factory):
         """Test fetching many rows."""
-        config = GoogleConfig(credentials_json='{}')
+        client, service = sheets_client_factory()
         
-        with patch('autobulk.sheets.Credentials.from_service_account_info'):
-            with patch('googleapiclient.discovery.build') as mock_build:
-                mock_service = MagicMock()
-                mock_build.return_value = mock_service
-                
-                client = SheetsClient(config)
-                
-                # Create a large dataset
-                rows = [['Name', 'Email']]
-                for i in range(1000):
-                    rows.append([f'User {i}', f'user{i}@example.com'])
-                
-                mock_service.spreadsheets().values().get().execute.return_value = {
-                    'values': rows
-                }
-                
-                recipients, errors = client.fetch_rows('test-sheet')
-                
-                assert len(recipients) == 1000
-                assert len(errors) == 0
+        # Create a large dataset
+        rows = [['Name', 'Email']]
+        for i in range(1000):
+            rows.append([f'User {i}', f'user{i}@example.com'])
+        
+        service.values = {
+            'values': rows
+        }
+        
+        recipients, errors = client.fetch_rows('test-sheet')
+        
+        assert len(recipients) == 1000
+        assert len(errors) == 0
 
 
 class TestEdgeCases:
@@ -461,26 +722,19 @@ class TestEdgeCases:
         )
         assert recipient.name == "José María"
     
-    def test_column_names_case_insensitive(self):
+    def test_column_names_case_insensitive(self, sheets_client_factory):
         """Test that column names are case-insensitive."""
-        config = GoogleConfig(credentials_json='{}')
+        client, service = sheets_client_factory()
         
-        with patch('autobulk.sheets.Credentials.from_service_account_info'):
-            with patch('googleapiclient.discovery.build') as mock_build:
-                mock_service = MagicMock()
-                mock_build.return_value = mock_service
-                
-                client = SheetsClient(config)
-                
-                # Use uppercase column names
-                mock_service.spreadsheets().values().get().execute.return_value = {
-                    'values': [
-                        ['NAME', 'EMAIL'],
-                        ['John Doe', 'john@example.com'],
-                    ]
-                }
-                
-                recipients, errors = client.fetch_rows('test-sheet')
-                
-                assert len(recipients) == 1
-                assert recipients[0].name == "John Doe"
+        # Use uppercase column names
+        service.values = {
+            'values': [
+                ['NAME', 'EMAIL'],
+                ['John Doe', 'john@example.com'],
+            ]
+        }
+        
+        recipients, errors = client.fetch_rows('test-sheet')
+        
+        assert len(recipients) == 1
+        assert recipients[0].name == "John Doe"